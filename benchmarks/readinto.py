@@ -0,0 +1,67 @@
+"""
+Micro-benchmark of the per-call overhead of `readinto` with small reads.
+
+Every call reads `--size` bytes from the same position of a temporary file, so the
+data is always in the page cache and the measure is dominated by the call overhead.
+
+Run it from the repository root with:
+
+    python -m benchmarks.readinto [--size SIZE] [--number NUMBER]
+"""
+
+import argparse
+import os
+import timeit
+from tempfile import TemporaryDirectory
+
+from io_chunks import FastRawIOChunk, RawIOChunk
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=64, help="bytes per read")
+    parser.add_argument("--number", type=int, default=200_000, help="reads per run")
+    parser.add_argument("--repeat", type=int, default=5, help="runs, best is shown")
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, "data")
+        with open(path, "wb") as file_handle:
+            file_handle.write(os.urandom(args.size * 16))
+        with open(path, "rb", buffering=0) as file_io, open(path, "rb") as buffered:
+            fd = file_io.fileno()
+            array = bytearray(args.size)
+            raw_chunk = RawIOChunk(buffered, size=args.size * 8, start=args.size)
+            fast_chunk = FastRawIOChunk(buffered, size=args.size * 8, start=args.size)
+            cases = {
+                "os.preadv": lambda: os.preadv(fd, (array,), args.size),
+                "FileIO.readinto": lambda: file_io.readinto(array),
+                "FastRawIOChunk.readinto": lambda: fast_chunk.readinto(array),
+                "RawIOChunk.readinto": lambda: raw_chunk.readinto(array),
+            }
+            resets = {
+                "FileIO.readinto": lambda: file_io.seek(args.size),
+                "FastRawIOChunk.readinto": lambda: fast_chunk.seek(0),
+                "RawIOChunk.readinto": lambda: raw_chunk.seek(0),
+            }
+            baseline = None
+            for name, case in cases.items():
+                reset = resets.get(name, lambda: None)
+
+                def call():
+                    reset()
+                    case()
+
+                best = min(timeit.repeat(call, number=args.number, repeat=args.repeat))
+                nanoseconds = best / args.number * 1e9
+                if baseline is None:
+                    baseline = nanoseconds
+                print(
+                    f"{name:<24} {nanoseconds:8.0f} ns/call"
+                    f" {nanoseconds / baseline:6.2f}x"
+                )
+            fast_chunk.close()
+
+
+if __name__ == "__main__":
+    main()
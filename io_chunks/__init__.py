@@ -1,3 +1,5 @@
+from io_chunks.chunk_opener import ChunkOpener, PooledRawIOChunk  # noqa: F401
+from io_chunks.fast_raw_io_chunk import FastRawIOChunk  # noqa: F401
 from io_chunks.raw_io_chunk import RawIOChunk  # noqa: F401
 
-__all__ = ["RawIOChunk"]
+__all__ = ["ChunkOpener", "FastRawIOChunk", "PooledRawIOChunk", "RawIOChunk"]
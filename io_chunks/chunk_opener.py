@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import errno
+import os
+from collections import OrderedDict
+from io import FileIO
+from types import TracebackType
+from typing import List, Optional, Type, Union
+
+from .exceptions import ClosedStreamError
+from .raw_io_chunk import RawIOChunk
+
+DEFAULT_MAX_FDS = 64
+
+
+class PooledRawIOChunk(RawIOChunk):
+    """
+    A `RawIOChunk` backed by a file descriptor leased from a `ChunkOpener`.
+
+    Unlike a plain `RawIOChunk`, the descriptor isn't shared with any other chunk
+    while it's leased, so the chunk can be read and seeked independently from the
+    others.
+    If the opener reclaims the descriptor to serve another chunk, a new one is leased
+    transparently on the next read.
+
+    Instances are meant to be created with `ChunkOpener.open`.
+    """
+
+    def __init__(self, opener: ChunkOpener, size: int, start: int = 0) -> None:
+        """
+        Creates a new PooledRawIOChunk.
+
+        :param opener: The opener which owns the file descriptors.
+        :type opener: ChunkOpener
+        :param int size: The size of the chunk.
+        :param int start: The start position in the file.
+        :raises ValueError: If `opener` is closed.
+        """
+        if not isinstance(start, int):
+            raise TypeError(f"start: expected int, got {type(start)}")
+        self._opener = opener
+        self._handle: Optional[FileIO] = None
+        try:
+            super().__init__(opener._lease(self), size, start)
+        except BaseException:
+            opener._release(self)
+            raise
+
+    def readinto(  # type: ignore[override]
+        self, array: Union[bytearray, memoryview]
+    ) -> Union[int, None]:
+        """
+        Read bytes into a pre-allocated array, leasing a file descriptor from the
+        opener if the previous one was reclaimed.
+        """
+        if self.closed:
+            raise ClosedStreamError()
+        self._stream = self._opener._lease(self)
+        return super().readinto(array)
+
+    def _sparse_fileno(self) -> Optional[int]:
+        """
+        Leases a file descriptor before looking for holes in it.
+        """
+        self._stream = self._opener._lease(self)
+        return super()._sparse_fileno()
+
+    def _sub_chunk(self, size: int, start: int) -> PooledRawIOChunk:
+        """
+        Returns a new chunk given by the same opener.
+        """
+        return self._opener.open(size, start)
+
+    def close(self) -> None:
+        """
+        Mark this instance as closed and return its file descriptor to the opener's
+        pool.
+        """
+        if not self._closed:
+            self._opener._release(self)
+        super().close()
+
+    @property
+    def closed(self) -> bool:
+        """
+        Returns whenever the opener or this instance are closed.
+        """
+        return self._closed or self._opener.closed
+
+    def fileno(self) -> int:
+        """
+        Returns the `fileno` of the file descriptor leased by this chunk.
+        """
+        if self.closed:
+            raise ClosedStreamError()
+        self._stream = self._opener._lease(self)
+        return self._stream.fileno()
+
+
+class ChunkOpener:
+    """
+    Gives out chunks of a file, each one backed by its own file descriptor.
+
+    The file descriptors are pooled and reused between chunks: when a chunk is
+    closed its descriptor goes back to the pool, and when `max_fds` descriptors are
+    in use the least recently used one is reclaimed from its chunk.
+    This allows to keep a large number of chunks over the same file without running
+    out of file descriptors or opening the file once per chunk.
+
+    This class is not thread-safe.
+    """
+
+    def __init__(
+        self, path: Union[str, bytes, os.PathLike], max_fds: int = DEFAULT_MAX_FDS
+    ) -> None:
+        """
+        Creates a new ChunkOpener.
+
+        :param path: The path of the file to open.
+        :type path: str, bytes or os.PathLike
+        :param int max_fds: The maximum number of file descriptors opened at the same
+            time.
+        :raises ValueError: If `max_fds` is lower than 1.
+        :raises OSError: If the file cannot be opened.
+        """
+        if not isinstance(max_fds, int):
+            raise TypeError(f"max_fds: expected int, got {type(max_fds)}")
+        if max_fds < 1:
+            raise ValueError(f"max_fds: expected a positive value, got {max_fds}")
+        self._path = os.fspath(path)
+        self._max_fds = max_fds
+        self._closed = False
+        # Open a first file descriptor so errors are raised as early as possible.
+        handle = FileIO(self._path, "r")
+        stat = os.fstat(handle.fileno())
+        # Identity of the file, to detect if the path is replaced while in use.
+        self._file_id = (stat.st_dev, stat.st_ino)
+        self._idle: List[FileIO] = [handle]
+        # Leased file descriptors, from the least to the most recently used.
+        self._leased: OrderedDict[FileIO, PooledRawIOChunk] = OrderedDict()
+
+    @property
+    def path(self) -> Union[str, bytes]:
+        """Path of the opened file."""
+        return self._path
+
+    @property
+    def max_fds(self) -> int:
+        """Maximum number of file descriptors opened at the same time."""
+        return self._max_fds
+
+    @property
+    def open_fds(self) -> int:
+        """Number of file descriptors currently opened, leased or not."""
+        return len(self._idle) + len(self._leased)
+
+    @property
+    def closed(self) -> bool:
+        """Returns whenever this instance is closed."""
+        return self._closed
+
+    def open(self, size: int, start: int = 0) -> PooledRawIOChunk:
+        """
+        Creates a new chunk of the file.
+
+        :param int size: The size of the chunk.
+        :param int start: The start position in the file.
+        :rtype: PooledRawIOChunk
+        :raises ValueError: If this instance is closed.
+        :raises OSError: If a new file descriptor is needed and the path no longer
+            refers to the same file.
+        """
+        return PooledRawIOChunk(self, size, start)
+
+    def close(self) -> None:
+        """
+        Close all the file descriptors; all the chunks given by this instance are
+        closed too.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        for chunk in self._leased.values():
+            chunk._handle = None
+        handles = self._idle + list(self._leased)
+        self._idle = []
+        self._leased.clear()
+        for handle in handles:
+            handle.close()
+
+    def __enter__(self) -> ChunkOpener:
+        if self._closed:
+            raise ValueError("I/O operation on closed opener")
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def _lease(self, chunk: PooledRawIOChunk) -> FileIO:
+        """
+        Returns the file descriptor leased by `chunk`, leasing a new one if needed.
+        """
+        if self._closed:
+            raise ValueError("I/O operation on closed opener")
+        handle = chunk._handle
+        if handle is not None:
+            self._leased.move_to_end(handle)
+            return handle
+        if self._idle:
+            handle = self._idle.pop()
+        elif len(self._leased) < self._max_fds:
+            handle = self._reopen()
+        else:
+            handle, owner = self._leased.popitem(last=False)
+            owner._handle = None
+        self._leased[handle] = chunk
+        chunk._handle = handle
+        return handle
+
+    def _reopen(self) -> FileIO:
+        """
+        Opens a new file descriptor of the file.
+
+        :raises OSError: If the path no longer refers to the same file.
+        """
+        handle = FileIO(self._path, "r")
+        stat = os.fstat(handle.fileno())
+        if (stat.st_dev, stat.st_ino) != self._file_id:
+            handle.close()
+            raise OSError(
+                errno.ESTALE,
+                "file was replaced since the opener was created",
+                self._path,
+            )
+        return handle
+
+    def _release(self, chunk: PooledRawIOChunk) -> None:
+        """
+        Returns the file descriptor leased by `chunk`, if any, to the pool.
+        """
+        handle = chunk._handle
+        if handle is None or self._closed:
+            return
+        chunk._handle = None
+        del self._leased[handle]
+        self._idle.append(handle)
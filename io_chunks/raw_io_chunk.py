@@ -1,27 +1,103 @@
 from __future__ import annotations
 
+import errno
+import os
 from io import (
+    DEFAULT_BUFFER_SIZE,
     SEEK_CUR,
     SEEK_END,
     SEEK_SET,
     BufferedIOBase,
+    BufferedRandom,
+    BufferedReader,
+    FileIO,
     RawIOBase,
     UnsupportedOperation,
 )
 from types import TracebackType
-from typing import IO, Iterable, Optional, Type, Union
+from typing import IO, Iterable, Iterator, Optional, Tuple, Type, TypeVar, Union
 
 from .exceptions import ClosedStreamError
 
+# Not available in all the platforms, i.e. Windows.
+SEEK_DATA: Optional[int] = getattr(os, "SEEK_DATA", None)
+SEEK_HOLE: Optional[int] = getattr(os, "SEEK_HOLE", None)
 
-class RawIOChunk(RawIOBase, IO):
+# Reads smaller than this don't check for holes, as the extra system calls would
+# cost more than reading the zeros.
+_SPARSE_READ_MIN_SIZE = DEFAULT_BUFFER_SIZE
+
+# Copied into the arrays to fill the holes.
+_ZEROS = memoryview(bytes(DEFAULT_BUFFER_SIZE))
+
+_Chunk = TypeVar("_Chunk", bound="_RawIOChunkBase")
+
+
+def _file_io(stream: Union[RawIOBase, BufferedIOBase]) -> Optional[FileIO]:
     """
-    An IO read-only object with access to a portion of another IO object.
-    In other terms, a sub-stream of a stream.
+    Returns the `FileIO` of `stream` if its positions are the same as the file
+    positions, or `None` otherwise, i.e. for compressed streams or other chunks.
+    """
+    if isinstance(stream, (BufferedReader, BufferedRandom)):
+        stream = stream.raw
+    return stream if isinstance(stream, FileIO) else None
 
-    It's meant to be used with file-like objects from `open` so you can divide
-    the file stream in chunks without having an in-memory copy of all of its
-    contents.
+
+def _fill_zeros(array: memoryview, size: int) -> None:
+    """
+    Writes `size` zeros at the beginning of `array`.
+    """
+    for position in range(0, size, len(_ZEROS)):
+        end = min(position + len(_ZEROS), size)
+        array[position:end] = _ZEROS[: end - position]
+
+
+def _lseek_sparse(fd: int, offset: int, whence: int) -> Optional[int]:
+    """
+    Calls `os.lseek` with `SEEK_DATA` or `SEEK_HOLE`.
+
+    Returns `None` if there is no data or hole after `offset`.
+    If the file system doesn't support sparse files, the whole file is considered
+    data.
+    """
+    try:
+        return os.lseek(fd, offset, whence)
+    except OSError as error:
+        if error.errno == errno.ENXIO:
+            return None
+        if error.errno != errno.EINVAL:
+            raise
+    size = os.fstat(fd).st_size
+    if offset >= size:
+        return None
+    return offset if whence == SEEK_DATA else size
+
+
+def _next_data(fd: int, offset: int) -> Optional[Tuple[int, int]]:
+    """
+    Returns the start and end of the first data region of the file at or after
+    `offset`, or `None` if there isn't any.
+
+    The file descriptor position isn't changed.
+    """
+    assert SEEK_DATA is not None and SEEK_HOLE is not None
+    position = os.lseek(fd, 0, SEEK_CUR)
+    try:
+        data = _lseek_sparse(fd, offset, SEEK_DATA)
+        if data is None:
+            return None
+        hole = _lseek_sparse(fd, data, SEEK_HOLE)
+        # There is always a hole at the end of the file.
+        assert hole is not None
+        return data, hole
+    finally:
+        os.lseek(fd, position, SEEK_SET)
+
+
+class _RawIOChunkBase(RawIOBase, IO):
+    """
+    Common implementation of the chunk classes: argument validation and the methods
+    which don't read from the underlying stream.
     """
 
     def __init__(
@@ -30,19 +106,8 @@ class RawIOChunk(RawIOBase, IO):
         size: int,
         start: Optional[int] = None,
     ) -> None:
-        """
-        Creates a new RawIOChunk.
-
-        :param stream: An IO of file-like object with the original stream;
-            must be seekable.
-        :type stream: RawIOBase or BufferedIOBase
-        :param int size: The size of the chunk.
-        :param start: The start position in the original stream; if `None` it
-            uses the current stream position.
-        :type start: int or None
-        :raises ValueError: If `stream` is closed or not seekable.
-        """
         super().__init__()
+        self._closed = True
         if not isinstance(stream, (RawIOBase, BufferedIOBase)):
             raise TypeError(
                 f"stream: expected RawIOBase or BufferedIOBase, got {type(stream)}"
@@ -78,7 +143,7 @@ class RawIOChunk(RawIOBase, IO):
         """End position of the chunk"""
         return self._start + self._size
 
-    def __enter__(self) -> RawIOChunk:
+    def __enter__(self: _Chunk) -> _Chunk:
         if self.closed:
             raise ClosedStreamError()
         return self
@@ -91,6 +156,89 @@ class RawIOChunk(RawIOBase, IO):
     ) -> None:
         self.close()
 
+    def truncate(self, size: Optional[int] = None) -> int:
+        """
+        Resize the chunk to the given size, or to the current position if size is
+        `None`.
+        The current position isn't changed.
+        """
+        if size is None:
+            size = self._cursor
+        elif size < 0:
+            raise ValueError(f"negative size value {size}")
+        self._size = size
+        return self._size
+
+    def tell(self) -> int:
+        if self.closed:
+            raise ClosedStreamError()
+        return self._cursor
+
+    def seekable(self) -> bool:
+        if self.closed:
+            raise ClosedStreamError()
+        return True
+
+    def readable(self) -> bool:
+        if self.closed:
+            raise ClosedStreamError()
+        return True
+
+    def write(self, bytes) -> int:
+        """
+        This stream doesn't support writing.
+
+        :raises UnsupportedOperation:
+        """
+        raise UnsupportedOperation("This stream doesn't support write")
+
+    def writelines(self, lines: Iterable[bytes]):  # type: ignore[override]
+        """
+        This stream doesn't support writing.
+
+        :raises UnsupportedOperation:
+        """
+        raise UnsupportedOperation("This stream doesn't support write")
+
+
+class RawIOChunk(_RawIOChunkBase):
+    """
+    An IO read-only object with access to a portion of another IO object.
+    In other terms, a sub-stream of a stream.
+
+    It's meant to be used with file-like objects from `open` so you can divide
+    the file stream in chunks without having an in-memory copy of all of its
+    contents.
+
+    If the underlying stream is a file opened with `open`, holes of sparse files are
+    supported: `seek` accepts `os.SEEK_DATA` and `os.SEEK_HOLE`, reads fill the holes
+    with zeros without reading them and `iter_extents` yields the data regions.
+    """
+
+    def __init__(
+        self,
+        stream: Union[RawIOBase, BufferedIOBase],
+        size: int,
+        start: Optional[int] = None,
+    ) -> None:
+        """
+        Creates a new RawIOChunk.
+
+        :param stream: An IO of file-like object with the original stream;
+            must be seekable.
+        :type stream: RawIOBase or BufferedIOBase
+        :param int size: The size of the chunk.
+        :param start: The start position in the original stream; if `None` it
+            uses the current stream position.
+        :type start: int or None
+        :raises ValueError: If `stream` is closed or not seekable.
+        """
+        super().__init__(stream, size, start)
+        # Last data region found in the underlying file, to avoid looking for holes
+        # on every read.
+        self._data_start = 0
+        self._data_end = 0
+
     # The type definition of `array` in `RawIOBase` of Python 3.7 is as
     # follows:
     #     `Union[bytearray, memoryview, array[Any], mmap, _CData]`
@@ -106,6 +254,9 @@ class RawIOChunk(RawIOBase, IO):
         If the underlying stream is closed raises `ValueError`.
         If there si no more bytes to read in the underlying stream writes nothing and
         return 0, even if there was remaining bytes in the chunk.
+
+        If the underlying stream is a file, the holes of sparse files are filled with
+        zeros without reading them.
         """
         if self.closed:
             raise ClosedStreamError()
@@ -116,10 +267,18 @@ class RawIOChunk(RawIOBase, IO):
             return 0
         array = memoryview(array)
         array = array.cast("B")
-        position = self._stream.tell()
-        self._stream.seek(self._start + self._cursor)
         if len(array) > remaining:
             array = array[:remaining]
+        extent = self._sparse_extent(len(array))
+        if extent is not None:
+            in_hole, extent_size = extent
+            if in_hole:
+                _fill_zeros(array, extent_size)
+                self._cursor += extent_size
+                return extent_size
+            array = array[:extent_size]
+        position = self._stream.tell()
+        self._stream.seek(self._start + self._cursor)
         read_size = self._stream.readinto(array)
         if read_size is None:
             return None
@@ -144,39 +303,109 @@ class RawIOChunk(RawIOBase, IO):
             self._cursor += pos
         elif whence == SEEK_END:
             self._cursor = self._size + pos
+        elif whence in (SEEK_DATA, SEEK_HOLE):
+            self._cursor = self._seek_sparse(pos, whence)
         else:
             raise ValueError(f"whence: invalid value: {whence}")
         if self._cursor < 0:
             self._cursor = 0
         return self._cursor
 
-    def truncate(self, size: Optional[int] = None) -> int:
+    def _sparse_fileno(self) -> Optional[int]:
         """
-        Resize the chunk to the given size, or to the current position if size is
-        `None`.
-        The current position isn't changed.
+        Returns the file descriptor of the underlying stream, or `None` if it isn't a
+        file or the platform doesn't support sparse files.
         """
-        if size is None:
-            size = self._cursor
-        elif size < 0:
-            raise ValueError(f"negative size value {size}")
-        self._size = size
-        return self._size
+        if SEEK_DATA is None or SEEK_HOLE is None:
+            return None
+        file_io = _file_io(self._stream)
+        if file_io is None:
+            return None
+        fd = file_io.fileno()
+        # Looking for holes skips the stream buffer.
+        if self._stream.writable():
+            self._stream.flush()
+        return fd
 
-    def tell(self) -> int:
-        if self.closed:
-            raise ClosedStreamError()
-        return self._cursor
+    def _sub_chunk(self, size: int, start: int) -> RawIOChunk:
+        """
+        Returns a new chunk over the same underlying stream.
+        """
+        return RawIOChunk(self._stream, size=size, start=start)
 
-    def seekable(self) -> bool:
-        if self.closed:
-            raise ClosedStreamError()
-        return True
+    def _sparse_extent(self, size: int) -> Optional[Tuple[bool, int]]:
+        """
+        Returns whenever the current position is inside a hole and the size, up to
+        `size`, of the hole or data region from the current position.
 
-    def readable(self) -> bool:
+        Returns `None` if `size` is too small to be worth checking or the underlying
+        stream doesn't support sparse files.
+        """
+        if size < _SPARSE_READ_MIN_SIZE:
+            return None
+        offset = self._start + self._cursor
+        if not self._data_start <= offset < self._data_end:
+            fd = self._sparse_fileno()
+            if fd is None:
+                return None
+            extent = _next_data(fd, offset)
+            if extent is None:
+                # The rest of the file is a hole.
+                return True, max(min(os.fstat(fd).st_size - offset, size), 0)
+            if extent[0] > offset:
+                return True, min(extent[0] - offset, size)
+            # Only data regions are remembered: if they become holes the reads still
+            # return zeros, while a remembered hole may have been written.
+            self._data_start, self._data_end = extent
+        return False, min(self._data_end - offset, size)
+
+    def _seek_sparse(self, pos: int, whence: int) -> int:
+        """
+        Returns the chunk position of the next data or hole starting at `pos`.
+
+        The end of the chunk is considered a hole, like the end of a file.
+        """
+        fd = self._sparse_fileno()
+        if fd is None:
+            raise ValueError(f"whence: unsupported value for this stream: {whence}")
+        if pos < 0:
+            raise ValueError(f"negative seek value {pos}")
+        if pos >= self._size:
+            raise OSError(errno.ENXIO, os.strerror(errno.ENXIO))
+        offset = self._start + pos
+        extent = _next_data(fd, offset)
+        if whence == SEEK_DATA:
+            if extent is None or extent[0] >= self.end:
+                raise OSError(errno.ENXIO, os.strerror(errno.ENXIO))
+            return extent[0] - self._start
+        if extent is None or extent[0] > offset:
+            return pos
+        return min(extent[1], self.end) - self._start
+
+    def iter_extents(self) -> Iterator[RawIOChunk]:
+        """
+        Yields the data regions of the chunk as new chunks, skipping the holes.
+
+        If the underlying stream doesn't support sparse files yields a single chunk
+        with the same region as this one.
+        """
         if self.closed:
             raise ClosedStreamError()
-        return True
+        fd = self._sparse_fileno()
+        if fd is None:
+            yield self._sub_chunk(size=self._size, start=self._start)
+            return
+        end = self.end
+        position = self._start
+        while position < end:
+            extent = _next_data(fd, position)
+            if extent is None or extent[0] >= end:
+                return
+            position = min(extent[1], end)
+            yield self._sub_chunk(size=position - extent[0], start=extent[0])
+            # The file descriptor may change while the chunk is used elsewhere.
+            fd = self._sparse_fileno()
+            assert fd is not None
 
     def close(self) -> None:
         """
@@ -193,24 +422,8 @@ class RawIOChunk(RawIOBase, IO):
         """
         return self._stream.closed or self._closed
 
-    def write(self, bytes) -> int:
-        """
-        This streams doesn't support writing.
-
-        :raises UnsupportedOperation:
-        """
-        raise UnsupportedOperation("This stream doesn't support write")
-
     def fileno(self) -> int:
         """
         Returns the underlying stream `fileno`.
         """
         return self._stream.fileno()
-
-    def writelines(self, lines: Iterable[bytes]):  # type: ignore[override]
-        """
-        This streams doesn't support writing.
-
-        :raises UnsupportedOperation:
-        """
-        raise UnsupportedOperation("This stream doesn't support write")
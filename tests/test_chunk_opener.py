@@ -0,0 +1,146 @@
+import os
+import re
+from io import SEEK_END, BufferedReader
+
+import pytest
+
+from io_chunks.chunk_opener import ChunkOpener, PooledRawIOChunk
+from io_chunks.exceptions import ClosedStreamError
+from io_chunks.raw_io_chunk import SEEK_DATA
+
+
+@pytest.fixture
+def path(tmp_path):
+    file_path = tmp_path / "file"
+    file_path.write_bytes(b"0123456789")
+    return file_path
+
+
+def test_open(path):
+    with ChunkOpener(path) as opener:
+        chunk = opener.open(size=5, start=2)
+        assert chunk.start == 2
+        assert chunk.size == 5
+        assert chunk.end == 7
+        assert chunk.read() == b"23456"
+
+
+def test_independent_file_descriptors(path):
+    with ChunkOpener(path) as opener:
+        first = opener.open(size=5)
+        second = opener.open(size=5, start=5)
+        assert first.fileno() != second.fileno()
+        assert opener.open_fds == 2
+
+
+def test_independent_buffered_readers(path):
+    with ChunkOpener(path) as opener:
+        first = BufferedReader(opener.open(size=5))
+        second = BufferedReader(opener.open(size=5, start=5))
+        assert first.read(2) == b"01"
+        assert second.read(2) == b"56"
+        second.seek(-1, SEEK_END)
+        assert first.read() == b"234"
+        assert second.read() == b"9"
+
+
+def test_close_returns_file_descriptor(path):
+    with ChunkOpener(path) as opener:
+        first = opener.open(size=5)
+        fileno = first.fileno()
+        first.close()
+        second = opener.open(size=5, start=5)
+        assert second.fileno() == fileno
+        assert opener.open_fds == 1
+
+
+def test_max_fds(path):
+    with ChunkOpener(path, max_fds=2) as opener:
+        chunks = [opener.open(size=1, start=position) for position in range(10)]
+        assert opener.open_fds == 2
+        assert [chunk.read() for chunk in chunks] == [
+            str(position).encode() for position in range(10)
+        ]
+        assert opener.open_fds == 2
+
+
+def test_max_fds_reclaims_least_recently_used(path):
+    with ChunkOpener(path, max_fds=2) as opener:
+        first = opener.open(size=5)
+        second = opener.open(size=5, start=5)
+        assert first.read(1) == b"0"
+        third = opener.open(size=2, start=8)
+        assert second._handle is None
+        assert first._handle is not None
+        assert third.read() == b"89"
+        assert second.read() == b"56789"
+        assert first.read() == b"1234"
+
+
+def test_max_fds_invalid(path):
+    with pytest.raises(ValueError, match=re.escape("max_fds: expected a positive")):
+        ChunkOpener(path, max_fds=0)
+
+
+def test_open_invalid_size_releases_file_descriptor(path):
+    with ChunkOpener(path, max_fds=1) as opener:
+        with pytest.raises(TypeError):
+            opener.open(size="x")  # type: ignore[arg-type]
+        assert opener.open_fds == 1
+        assert not opener._leased
+
+
+def test_file_replaced(path):
+    with ChunkOpener(path, max_fds=2) as opener:
+        first = opener.open(size=5)
+        replacement = path.with_name("replacement")
+        replacement.write_bytes(b"abcdefghij")
+        os.replace(replacement, path)
+        with pytest.raises(OSError, match=re.escape("file was replaced")):
+            opener.open(size=5, start=5)
+        assert opener.open_fds == 1
+        assert first.read() == b"01234"
+
+
+def test_path_not_found(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ChunkOpener(tmp_path / "missing")
+
+
+def test_close_opener(path):
+    opener = ChunkOpener(path)
+    chunk = opener.open(size=5)
+    handle = chunk._handle
+    opener.close()
+    assert opener.closed is True
+    assert chunk.closed is True
+    assert handle.closed is True
+    assert opener.open_fds == 0
+    with pytest.raises(ClosedStreamError):
+        chunk.read()
+    with pytest.raises(ValueError, match=re.escape("closed opener")):
+        opener.open(size=5)
+
+
+def test_close_chunk(path):
+    with ChunkOpener(path) as opener:
+        chunk = opener.open(size=5)
+        chunk.close()
+        assert chunk.closed is True
+        assert opener.closed is False
+        with pytest.raises(ClosedStreamError):
+            chunk.read()
+
+
+@pytest.mark.skipif(SEEK_DATA is None, reason="sparse files not supported")
+def test_iter_extents(path):
+    with ChunkOpener(path, max_fds=1) as opener:
+        chunk = opener.open(size=5, start=2)
+        extents = list(chunk.iter_extents())
+        assert [(extent.start, extent.size) for extent in extents] == [(2, 5)]
+        assert isinstance(extents[0], PooledRawIOChunk)
+        assert chunk.seek(0, SEEK_DATA) == 0
+        assert extents[0].read() == b"23456"
+        assert chunk.read() == b"23456"
+    with pytest.raises(ClosedStreamError):
+        chunk.seek(0, SEEK_DATA)
@@ -0,0 +1,151 @@
+import gzip
+import os
+import re
+import tarfile
+from io import SEEK_CUR, SEEK_END, BufferedReader, BytesIO
+from tempfile import TemporaryFile
+from types import MemberDescriptorType
+
+import pytest
+
+from io_chunks.exceptions import ClosedStreamError
+from io_chunks.fast_raw_io_chunk import FastRawIOChunk
+from io_chunks.raw_io_chunk import RawIOChunk
+
+
+@pytest.fixture
+def file_handle(tmp_path):
+    path = tmp_path / "file"
+    path.write_bytes(b"0123456789")
+    with open(path, "rb") as file_handle:
+        yield file_handle
+
+
+@pytest.fixture(params=["BytesIO", "file"])
+def buffer(request, file_handle):
+    if request.param == "file":
+        return file_handle
+    return BytesIO(b"0123456789")
+
+
+def test_file_middle(buffer):
+    chunk = FastRawIOChunk(buffer, size=5, start=2)
+    assert chunk.start == 2
+    assert chunk.size == 5
+    assert chunk.end == 7
+    assert chunk.read() == b"23456"
+    assert chunk.read() == b""
+    assert buffer.tell() == 0
+
+
+def test_read_past_eof(buffer):
+    chunk = FastRawIOChunk(buffer, size=6, start=5)
+    assert chunk.read() == b"56789"
+    assert chunk.read(1) == b""
+
+
+def test_readinto_partial(buffer):
+    chunk = FastRawIOChunk(buffer, size=5, start=2)
+    array = bytearray(3)
+    assert chunk.readinto(array) == 3
+    assert array == b"234"
+    assert chunk.readinto(array) == 2
+    assert array[:2] == b"56"
+    assert chunk.readinto(array) == 0
+
+
+def test_seek(buffer):
+    chunk = FastRawIOChunk(buffer, size=5, start=5)
+    assert chunk.seek(1) == 1
+    assert chunk.seek(1, SEEK_CUR) == 2
+    assert chunk.seek(-1, SEEK_END) == 4
+    assert chunk.seek(-10, SEEK_CUR) == 0
+    assert chunk.seek(2) == 2
+    assert chunk.read() == b"789"
+
+
+def test_seek_negative_invalid(buffer):
+    chunk = FastRawIOChunk(buffer, size=5, start=5)
+    with pytest.raises(ValueError, match=re.escape("negative seek value -2")):
+        chunk.seek(-2)
+
+
+def test_seek_whence_invalid(buffer):
+    chunk = FastRawIOChunk(buffer, size=5, start=5)
+    with pytest.raises(ValueError, match=re.escape("whence: invalid value: 10")):
+        chunk.seek(0, 10)
+
+
+def test_buffered_reader(buffer):
+    chunk = BufferedReader(FastRawIOChunk(buffer, size=5, start=3))
+    assert chunk.read(2) == b"34"
+    assert chunk.read() == b"567"
+
+
+def test_file_descriptor_duplicated(file_handle):
+    chunk = FastRawIOChunk(file_handle, size=5, start=2)
+    fileno = chunk.fileno()
+    assert fileno != file_handle.fileno()
+    file_handle.close()
+    assert chunk.closed is False
+    assert chunk.read() == b"23456"
+    chunk.close()
+    with pytest.raises(OSError):
+        os.fstat(fileno)
+
+
+def test_close(buffer):
+    chunk = FastRawIOChunk(buffer, size=5)
+    chunk.close()
+    assert chunk.closed is True
+    assert buffer.closed is False
+    with pytest.raises(ClosedStreamError):
+        chunk.read()
+
+
+def test_writable_stream():
+    with TemporaryFile("w+b") as buffer:
+        buffer.write(b"0123456789")
+        chunk = FastRawIOChunk(buffer, size=10, start=0)
+        buffer.seek(0)
+        buffer.write(b"XY")
+        assert chunk.read() == b"XY23456789"
+        assert buffer.tell() == 2
+
+
+def test_gzip(tmp_path):
+    path = tmp_path / "file.gz"
+    with gzip.open(path, "wb") as file_handle:
+        file_handle.write(b"0123456789abcdef")
+    with gzip.open(path, "rb") as file_handle:
+        chunk = FastRawIOChunk(file_handle, size=11, start=2)
+        assert chunk.fileno() == file_handle.fileno()
+        assert chunk.read() == b"23456789abc"
+
+
+def test_nested_chunk(tmp_path):
+    path = tmp_path / "file"
+    path.write_bytes(b"0123456789abcdef")
+    with open(path, "rb") as file_handle:
+        chunk = FastRawIOChunk(RawIOChunk(file_handle, size=8, start=8), size=4)
+        assert chunk.read() == b"89ab"
+
+
+def test_tar_member(tmp_path):
+    path = tmp_path / "file.tar"
+    with tarfile.open(path, "w") as tar:
+        info = tarfile.TarInfo("member")
+        info.size = 10
+        tar.addfile(info, BytesIO(b"0123456789"))
+    with tarfile.open(path) as tar:
+        member = tar.extractfile("member")
+        assert member is not None
+        chunk = FastRawIOChunk(member, size=5, start=3)
+        assert chunk.read() == b"34567"
+
+
+def test_slots():
+    chunk = FastRawIOChunk(BytesIO(b"0123456789"), size=5)
+    for name in FastRawIOChunk.__slots__:
+        assert isinstance(getattr(FastRawIOChunk, name), MemberDescriptorType)
+        assert name not in vars(chunk)
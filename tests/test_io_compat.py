@@ -9,10 +9,11 @@ from dataclasses import dataclass
 from io import SEEK_CUR, SEEK_END, BufferedIOBase, BytesIO, RawIOBase
 from itertools import product
 from tempfile import TemporaryFile
-from typing import IO, Any, Callable, ContextManager
+from typing import IO, Any, Callable, ContextManager, cast
 
 import pytest
 
+from io_chunks.fast_raw_io_chunk import FastRawIOChunk
 from io_chunks.raw_io_chunk import RawIOChunk
 
 IOFactory = Callable[[], IO]
@@ -101,6 +102,43 @@ USE_CASES = [
         seek_data_expect=pytest.raises(ValueError),
         truncate_negative_expect=pytest.raises(ValueError),
     ),
+    UseCase(
+        factory=lambda: RawIOChunk(
+            cast(BufferedIOBase, temp_file_factory(b"01234")), size=5
+        ),
+        name="RawIOChunk (TempFile)",
+        size=5,
+        full_read_result=b"01234",
+        negative_seek_expect=pytest.raises(ValueError),
+        before_start_seek_expect=does_not_raise(),
+        seek_hole_expect=does_not_raise(),
+        seek_data_expect=does_not_raise(),
+        truncate_negative_expect=pytest.raises(ValueError),
+    ),
+    UseCase(
+        factory=lambda: FastRawIOChunk(BytesIO(b"01234"), size=5),
+        name="FastRawIOChunk",
+        size=5,
+        full_read_result=b"01234",
+        negative_seek_expect=pytest.raises(ValueError),
+        before_start_seek_expect=does_not_raise(),
+        seek_hole_expect=pytest.raises(ValueError),
+        seek_data_expect=pytest.raises(ValueError),
+        truncate_negative_expect=pytest.raises(ValueError),
+    ),
+    UseCase(
+        factory=lambda: FastRawIOChunk(
+            cast(BufferedIOBase, temp_file_factory(b"01234")), size=5
+        ),
+        name="FastRawIOChunk (TempFile)",
+        size=5,
+        full_read_result=b"01234",
+        negative_seek_expect=pytest.raises(ValueError),
+        before_start_seek_expect=does_not_raise(),
+        seek_hole_expect=pytest.raises(ValueError),
+        seek_data_expect=pytest.raises(ValueError),
+        truncate_negative_expect=pytest.raises(ValueError),
+    ),
     UseCase(
         factory=lambda: temp_file_factory(b"01234"),
         name="TempFile",
@@ -1,10 +1,41 @@
+import errno
+import gzip
+import io
+import os
 import re
+import tarfile
 from io import SEEK_CUR, SEEK_END, BytesIO
+from tempfile import TemporaryFile
 
 import pytest
 
+from io_chunks import raw_io_chunk
 from io_chunks.exceptions import ClosedStreamError
-from io_chunks.raw_io_chunk import RawIOChunk
+from io_chunks.raw_io_chunk import SEEK_DATA, SEEK_HOLE, RawIOChunk
+
+BLOCK_SIZE = 4096
+
+
+@pytest.fixture
+def sparse_file(tmp_path):
+    """
+    A file with holes at [0, 16 blocks), [17 blocks, 48 blocks) and
+    [49 blocks, 64 blocks).
+    """
+    if SEEK_DATA is None:
+        pytest.skip("sparse files not supported by the platform")
+    path = tmp_path / "sparse"
+    with open(path, "wb") as file_handle:
+        file_handle.seek(16 * BLOCK_SIZE)
+        file_handle.write(b"a" * BLOCK_SIZE)
+        file_handle.seek(48 * BLOCK_SIZE)
+        file_handle.write(b"b" * BLOCK_SIZE)
+        file_handle.truncate(64 * BLOCK_SIZE)
+    with open(path, "rb") as file_handle:
+        if os.lseek(file_handle.fileno(), 0, SEEK_DATA) == 0:
+            pytest.skip("sparse files not supported by the file system")
+        file_handle.seek(0)
+        yield file_handle
 
 
 def test_file_begin():
@@ -190,3 +221,166 @@ def test_truncate_doesnt_change_position():
         assert chunk.read() == b"3"
         assert chunk.truncate(5) == 5
         assert chunk.read() == b"456"
+
+
+def test_seek_data_hole(sparse_file):
+    chunk = RawIOChunk(sparse_file, size=40 * BLOCK_SIZE, start=8 * BLOCK_SIZE)
+    assert chunk.seek(0, SEEK_DATA) == 8 * BLOCK_SIZE
+    assert chunk.tell() == 8 * BLOCK_SIZE
+    assert chunk.seek(chunk.tell(), SEEK_HOLE) == 9 * BLOCK_SIZE
+    assert chunk.seek(0, SEEK_HOLE) == 0
+    assert sparse_file.tell() == 0
+
+
+def test_seek_data_hole_chunk_end(sparse_file):
+    chunk = RawIOChunk(sparse_file, size=20 * BLOCK_SIZE, start=8 * BLOCK_SIZE)
+    # The end of the chunk behaves as the end of the file.
+    with pytest.raises(OSError):
+        chunk.seek(10 * BLOCK_SIZE, SEEK_DATA)
+    with pytest.raises(OSError):
+        chunk.seek(20 * BLOCK_SIZE, SEEK_HOLE)
+    chunk.seek(8 * BLOCK_SIZE)
+    assert chunk.seek(8 * BLOCK_SIZE, SEEK_HOLE) == 9 * BLOCK_SIZE
+    assert chunk.seek(10 * BLOCK_SIZE, SEEK_HOLE) == 10 * BLOCK_SIZE
+
+
+def test_seek_data_hole_not_supported():
+    with BytesIO(b"0123456789") as buffer:
+        chunk = RawIOChunk(buffer, size=5)
+        with pytest.raises(ValueError, match=re.escape("whence: unsupported value")):
+            chunk.seek(0, os.SEEK_DATA)
+
+
+def test_read_sparse(sparse_file):
+    chunk = RawIOChunk(sparse_file, size=40 * BLOCK_SIZE, start=15 * BLOCK_SIZE)
+    buffer = bytearray(b"x" * (4 * BLOCK_SIZE))
+    # Reads stop at the boundaries between holes and data.
+    assert chunk.readinto(buffer) == BLOCK_SIZE
+    assert buffer[:BLOCK_SIZE] == bytes(BLOCK_SIZE)
+    assert chunk.readinto(buffer) == BLOCK_SIZE
+    assert buffer[:BLOCK_SIZE] == b"a" * BLOCK_SIZE
+    chunk.seek(0)
+    assert chunk.read() == (
+        bytes(BLOCK_SIZE)
+        + b"a" * BLOCK_SIZE
+        + bytes(31 * BLOCK_SIZE)
+        + b"b" * BLOCK_SIZE
+        + bytes(6 * BLOCK_SIZE)
+    )
+    assert sparse_file.tell() == 0
+
+
+def test_read_sparse_past_eof(sparse_file):
+    chunk = RawIOChunk(sparse_file, size=8 * BLOCK_SIZE, start=60 * BLOCK_SIZE)
+    assert chunk.read() == bytes(4 * BLOCK_SIZE)
+    assert chunk.read() == b""
+
+
+def test_iter_extents(sparse_file):
+    chunk = RawIOChunk(sparse_file, size=40 * BLOCK_SIZE, start=16 * BLOCK_SIZE + 10)
+    extents = list(chunk.iter_extents())
+    assert [(extent.start, extent.size) for extent in extents] == [
+        (16 * BLOCK_SIZE + 10, BLOCK_SIZE - 10),
+        (48 * BLOCK_SIZE, BLOCK_SIZE),
+    ]
+    assert extents[0].read() == b"a" * (BLOCK_SIZE - 10)
+    assert extents[1].read() == b"b" * BLOCK_SIZE
+
+
+def test_iter_extents_not_supported():
+    with BytesIO(b"0123456789") as buffer:
+        chunk = RawIOChunk(buffer, size=5, start=2)
+        extents = list(chunk.iter_extents())
+        assert [(extent.start, extent.size) for extent in extents] == [(2, 5)]
+
+
+def test_read_sparse_unflushed_write(sparse_file):
+    with TemporaryFile("w+b") as buffer:
+        buffer.truncate(16 * BLOCK_SIZE)
+        buffer.seek(0)
+        buffer.write(b"q" * 100)
+        chunk = RawIOChunk(buffer, size=4 * BLOCK_SIZE, start=0)
+        assert chunk.read() == b"q" * 100 + bytes(4 * BLOCK_SIZE - 100)
+
+
+def test_read_sparse_remembers_data(sparse_file, monkeypatch):
+    chunk = RawIOChunk(sparse_file, size=BLOCK_SIZE, start=16 * BLOCK_SIZE)
+    buffer = bytearray(BLOCK_SIZE // 2)
+    monkeypatch.setattr(raw_io_chunk, "_SPARSE_READ_MIN_SIZE", BLOCK_SIZE // 2)
+    assert chunk.readinto(buffer) == BLOCK_SIZE // 2
+    calls = []
+    lseek = os.lseek
+    monkeypatch.setattr(
+        raw_io_chunk.os, "lseek", lambda *args: calls.append(args) or lseek(*args)
+    )
+    assert chunk.readinto(buffer) == BLOCK_SIZE // 2
+    assert buffer == b"a" * (BLOCK_SIZE // 2)
+    assert calls == []
+
+
+@pytest.fixture
+def no_sparse_support(monkeypatch):
+    lseek = os.lseek
+
+    def lseek_without_sparse(fd, offset, whence):
+        if whence in (SEEK_DATA, SEEK_HOLE):
+            raise OSError(errno.EINVAL, os.strerror(errno.EINVAL))
+        return lseek(fd, offset, whence)
+
+    monkeypatch.setattr(raw_io_chunk.os, "lseek", lseek_without_sparse)
+
+
+def test_seek_data_hole_not_supported_by_file_system(sparse_file, no_sparse_support):
+    chunk = RawIOChunk(sparse_file, size=40 * BLOCK_SIZE, start=8 * BLOCK_SIZE)
+    assert chunk.seek(0, SEEK_DATA) == 0
+    assert chunk.seek(0, SEEK_HOLE) == 40 * BLOCK_SIZE
+
+
+def test_iter_extents_not_supported_by_file_system(sparse_file, no_sparse_support):
+    chunk = RawIOChunk(sparse_file, size=80 * BLOCK_SIZE, start=8 * BLOCK_SIZE)
+    extents = list(chunk.iter_extents())
+    assert [(extent.start, extent.size) for extent in extents] == [
+        (8 * BLOCK_SIZE, 56 * BLOCK_SIZE)
+    ]
+
+
+def test_read_sparse_large_hole(sparse_file):
+    chunk = RawIOChunk(sparse_file, size=31 * BLOCK_SIZE, start=17 * BLOCK_SIZE)
+    buffer = bytearray(b"x" * (32 * BLOCK_SIZE))
+    assert chunk.readinto(buffer) == 31 * BLOCK_SIZE
+    assert buffer == bytes(31 * BLOCK_SIZE) + b"x" * BLOCK_SIZE
+
+
+def test_read_sparse_nested_chunk(sparse_file):
+    outer = RawIOChunk(sparse_file, size=40 * BLOCK_SIZE, start=8 * BLOCK_SIZE)
+    chunk = RawIOChunk(outer, size=4 * BLOCK_SIZE, start=8 * BLOCK_SIZE)
+    assert chunk.read() == b"a" * BLOCK_SIZE + bytes(3 * BLOCK_SIZE)
+    assert list(chunk.iter_extents())[0].size == 4 * BLOCK_SIZE
+    with pytest.raises(ValueError, match=re.escape("whence: unsupported value")):
+        chunk.seek(0, os.SEEK_DATA)
+
+
+def test_read_gzip(tmp_path):
+    contents = bytes(range(256)) * 1000
+    path = tmp_path / "file.gz"
+    with gzip.open(path, "wb") as file_handle:
+        file_handle.write(contents)
+    with gzip.open(path, "rb") as file_handle:
+        chunk = RawIOChunk(file_handle, size=200000, start=10)
+        assert chunk.read() == contents[10:200010]
+
+
+def test_read_tar_member(tmp_path):
+    contents = b"0123456789" * 2000
+    path = tmp_path / "file.tar"
+    with tarfile.open(path, "w") as tar:
+        info = tarfile.TarInfo("member")
+        info.size = len(contents)
+        tar.addfile(info, io.BytesIO(contents))
+    with tarfile.open(path) as tar:
+        member = tar.extractfile("member")
+        assert member is not None
+        chunk = RawIOChunk(member, size=10000, start=5)
+        assert chunk.read() == contents[5:10005]
+        with pytest.raises(ValueError, match=re.escape("whence: unsupported value")):
+            chunk.seek(0, os.SEEK_DATA)